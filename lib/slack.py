@@ -9,6 +9,11 @@ message subtypes.
 
 Classes:
     SlackClient: Manages interactions with the Slack API and provides methods for retrieving and formatting chat history.
+    ServerErrorRetryHandler: A slack_sdk RetryHandler for transient HTTP 5xx responses.
+    User, Channel: Lightweight records holding the user and channel fields used by the summarizer.
+
+Functions:
+    unescape_message_text: Restore the line breaks escaped in a formatted message.
 
 Constants:
     SKIP_SUMMARY_TAG, ADD_SUMMARY_TAG, POST_SUMMARY_TAG: Tags for channel summary management.
@@ -32,10 +37,17 @@ import logging
 import re
 import time
 import pprint
+import json
+import hashlib
+from pathlib import Path
+from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from slack_sdk.errors import SlackApiError
 from slack_sdk import WebClient
-from lib.utils import retry, sort_by_numeric_prefix
+from slack_sdk.http_retry import RetryHandler, RetryState, HttpRequest, HttpResponse
+from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler, RateLimitErrorRetryHandler
+from lib.utils import TokenBucket, sort_by_numeric_prefix
 
 # Constants
 SKIP_SUMMARY_TAG = "#skip-summary"
@@ -52,8 +64,79 @@ PIN_SUBTYPES = ["pinned_item", "unpinned_item"]
 ORIGINAL_SUBTYPES = ["system"]
 SYSTEM_SUBTYPES = CHANNEL_SUBTYPES + FILE_SUBTYPES + PIN_SUBTYPES + ORIGINAL_SUBTYPES
 
+# Precompiled patterns for message formatting
+_USER_RE = re.compile(r"<@([A-Z0-9]+)>")
+_MENTION_RE = re.compile(r"<([@#])([A-Z0-9]+)>")
+_BROADCAST_RE = re.compile(r"<!here>|<!channel>|<!everyone>")
+_SUBTEAM_RE = re.compile(r"<!subteam\^[A-Z0-9]+\|@([a-zA-Z0-9_]+)>")
+_ESCAPE_RE = re.compile(r"\\([\\n])")
+
+def unescape_message_text(text: str) -> str:
+    """
+    Undo the escaping applied to message bodies by `SlackClient.load_messages`.
+
+    Line breaks are escaped as "\\n" and backslashes as "\\\\", so a "\\n" the user actually typed
+    is restored as typed.
+
+    Args:
+        text (str): A formatted message.
+
+    Returns:
+        str: The message with real line breaks.
+
+    Example:
+        >>> unescape_message_text("Alice: line1\\nline2 C:\\\\new")
+        'Alice: line1\nline2 C:\\new'
+    """
+    return _ESCAPE_RE.sub(lambda match: "\n" if match.group(1) == "n" else "\\", text)
+
+@dataclass(slots=True)
+class User:
+    """ A Slack user, reduced to the fields needed to resolve mentions and speaker names. """
+    id: str
+    name: str
+    display_name: str
+    deleted: bool = False
+
+    @classmethod
+    def from_dict(cls, user: dict) -> "User":
+        """ Build a User from a users.list / users.info member dictionary. """
+        return cls(id=user['id'], name=user['name'],
+                   display_name=user['profile']['display_name'],
+                   deleted=bool(user.get('deleted')))
+
+@dataclass(slots=True)
+class Channel:
+    """ A Slack channel, reduced to the fields needed to select and summarize it. """
+    id: str
+    name: str
+    is_archived: bool
+    is_channel: bool
+    is_ext_shared: bool
+    is_org_shared: bool
+    purpose: str
+
+    @classmethod
+    def from_dict(cls, channel: dict) -> "Channel":
+        """ Build a Channel from a conversations.list channel dictionary. """
+        return cls(id=channel['id'], name=channel['name'],
+                   is_archived=channel['is_archived'], is_channel=channel['is_channel'],
+                   is_ext_shared=channel['is_ext_shared'], is_org_shared=channel['is_org_shared'],
+                   purpose=channel['purpose']['value'])
+
+class ServerErrorRetryHandler(RetryHandler):
+    """ A RetryHandler that retries Slack API calls answered with a transient HTTP 5xx error. """
+
+    def _can_retry(self, *, state: RetryState, request: HttpRequest,
+                   response: HttpResponse = None, error: Exception = None) -> bool:
+        return response is not None and response.status_code >= 500
+
 # Load settings from environment variables
 SLACK_API_WAITTIME = float(os.environ.get('SLACK_API_WAITTIME') or 60/20)
+SLACK_HISTORY_LIMIT = int(os.environ.get('SLACK_HISTORY_LIMIT') or 1000)
+THREAD_FETCH_WORKERS = int(os.environ.get('SLACK_THREAD_FETCH_WORKERS') or 8)
+SLACK_CACHE_DIR = Path(os.environ.get('SLACK_CACHE_DIR') or "~/.cache/slack-summarizer").expanduser()
+SLACK_CACHE_TTL = float(os.environ.get('SLACK_CACHE_TTL') or 6 * 60 * 60)
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -82,23 +165,52 @@ class SlackClient:
 
     Args:
         slack_api_token (str): The Slack Bot token used to authenticate with the Slack API.
+        refresh (bool, optional): If True, ignore the on-disk users cache and fetch them again. Defaults to False.
+        lazy_users (bool, optional): If True, skip fetching the full user list and resolve each user ID
+            on demand via users.info the first time it is seen. Defaults to False.
 
     Attributes:
         client (WebClient): The Slack WebClient object used for API calls.
-        users (list): A list of dictionaries containing information about each user in the Slack workspace.
-        channels (list): A list of dictionaries containing information about each public channel in the Slack workspace.
+        users (list[User]): The users in the Slack workspace. Empty when `lazy_users` is True.
+        channels (list[Channel]): The public channels in the Slack workspace selected for summarization.
 
     Methods:
         post_message(text, channel): Post a message to a specified Slack channel.
+        post_many(messages): Post several (text, channel) messages, preserving order within each channel.
         load_messages(channel_id, start_time, end_time): Retrieve and format the chat history for the specified channel between the given start and end times.
         get_user_name(user_id): Get the display name of a user with the given ID.
         replace_user_id_with_name(body_text): Replace user IDs in a chat message text with user display names.
     """
 
-    def __init__(self, slack_api_token: str):
-        self.client = WebClient(token=slack_api_token)
-        self.users = self._get_users_info()
-        self.channels = self._get_channels_info()
+    def __init__(self, slack_api_token: str, refresh: bool = False, lazy_users: bool = False):
+        # Rate-limited (429), server-error (5xx) and connection-failed calls are retried by the SDK
+        # itself, honoring Retry-After. Other API errors are not retryable and surface immediately.
+        self.client = WebClient(token=slack_api_token, retry_handlers=[
+            RateLimitErrorRetryHandler(max_retry_count=5),
+            ServerErrorRetryHandler(max_retry_count=3),
+            ConnectionErrorRetryHandler(max_retry_count=3),
+        ])
+        # most of api call limit is 20 per minute
+        self._rate_limiter = TokenBucket.from_interval(SLACK_API_WAITTIME)
+        # chat.postMessage allows about one message per second per channel
+        self._post_limiter = TokenBucket(rate_per_sec=1.0)
+        self._cache_key = hashlib.sha256(slack_api_token.encode()).hexdigest()[:16]
+        self._lazy_users = lazy_users
+        self._unresolved_user_ids = set()
+
+        # Users and channels are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if lazy_users:
+                users_future = executor.submit(list)
+            else:
+                users_future = executor.submit(
+                    self._load_or_fetch, "users", self._get_users_info, User, refresh)
+            # Channels are not cached: their purpose holds the summary tags, and an opt-out
+            # must take effect on the next run
+            channels_future = executor.submit(self._get_channels_info)
+            self.users = users_future.result()
+            self.channels = channels_future.result()
+        self._display_name_by_id, self._name_by_id = self._build_user_indexes(self.users)
 
     def post_message(self, text: str, channel):
         """
@@ -117,11 +229,43 @@ class SlackClient:
             client.post_message("Hello, World!", "YOUR_CHANNEL_ID")
             ```
         """
+        self._post_limiter.acquire()
         response = self.client.chat_postMessage(channel=channel, text=text)
         if not response["ok"]:
             logger.error('Failed to post message: %s', {response["error"]})
             raise SlackApiError('Failed to post message', response["error"])
 
+    def post_many(self, messages: list, max_workers: int = 4):
+        """
+        Post several messages, keeping their order within each channel.
+
+        Messages for the same channel are posted one after another, while different channels are
+        posted concurrently. All posts share the chat.postMessage rate limiter.
+
+        Args:
+            messages (list): A list of (text, channel) tuples.
+            max_workers (int, optional): The maximum number of channels posted to at once. Defaults to 4.
+
+        Raises:
+            SlackApiError: If an error occurs while attempting to post a message.
+
+        Example:
+            ```
+            client.post_many([("Hello", "C12345678"), ("World", "C12345678"), ("Hi", "C87654321")])
+            ```
+        """
+        texts_by_channel = {}
+        for text, channel in messages:
+            texts_by_channel.setdefault(channel, []).append(text)
+
+        def _post_channel(channel):
+            for text in texts_by_channel[channel]:
+                self.post_message(text, channel)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(_post_channel, channel) for channel in texts_by_channel]:
+                future.result()
+
     def load_messages(self, channel_id: str, start_time: datetime,
                     end_time: datetime) -> list:
         """ 
@@ -158,46 +302,25 @@ class SlackClient:
             System: Earlier message not retrieved
             -> Eve: I had a question about that too.
         """
+        start_ts = start_time.timestamp()
+        oldest = str(start_ts)
+        latest = str(end_time.timestamp())
 
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def _join_conversations(channel):
-            return self.client.conversations_join(channel=channel)
-
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def _fetch_conversations_history(channel, oldest, latest, limit, cursor=None):
-            return self.client.conversations_history(
-                channel=channel,
-                oldest=oldest,
-                latest=latest,
-                limit=limit,
-                cursor=cursor)
-
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def _fetch_conversations_replies(channel, timestamp,oldest, latest, limit, cursor=None):
-            return self.client.conversations_replies(
-                channel=channel,
-                ts=timestamp,
-                oldest=oldest,
-                latest=latest,
-                limit=limit,
-                cursor=cursor)
-
-        messages_info = []
+        messages = []
+        fetched_count = 0
         next_cursor = None  # 初期のカーソルをNoneに設定
 
         while True:
-            self._wait_api_call()
             try:
-                result = _fetch_conversations_history(
+                result = self._api_conversations_history(
                     channel=channel_id,
-                    oldest=str(start_time.timestamp()),
-                    latest=str(end_time.timestamp()),
-                    limit=1000,
+                    oldest=oldest,
+                    latest=latest,
+                    limit=SLACK_HISTORY_LIMIT,
                     cursor=next_cursor)  # カーソルを使用してメッセージを取得
             except SlackApiError as error:
                 if error.response['error'] == 'not_in_channel':
-                    self._wait_api_call()
-                    response = _join_conversations(channel=channel_id)
+                    response = self._api_conversations_join(channel=channel_id)
                     if not response["ok"]:
                         logger.error('Failed join new channel: %s', {channel_id})
                     continue  # チャンネルに参加した後、再度メッセージの取得を試みる
@@ -208,39 +331,59 @@ class SlackClient:
                 logger.error('Result is None')
                 return None
 
-            messages_info.extend(result["messages"])
             logger.debug('Raw result: %s', {result})
+            fetched_count += len(result["messages"])
+            # Filter out messages with EXCLUDED_SUBTYPES and bot_id while paginating
+            messages.extend(m for m in result["messages"]
+                            if m.get("subtype") not in EXCLUDED_SUBTYPES and "bot_id" not in m)
 
-            if result["has_more"]:
-                next_cursor = result['response_metadata']['next_cursor']
-            else:
+            # Messages are returned newest first, so stop once the window's start is reached
+            if result["messages"] and float(result["messages"][-1]["ts"]) <= start_ts:
+                break
+
+            next_cursor = (result.get("response_metadata") or {}).get("next_cursor")
+            if not result["has_more"] or not next_cursor:
                 break  # すべてのメッセージを取得した場合、ループを終了
 
-        logger.info('Total messages fetched: %s', {len(messages_info)})
-        if len(messages_info) > 0:
-            logger.debug('Raw message:')
-            logger.debug(pprint.pformat(messages_info))
+        logger.info('Total messages fetched: %s', {fetched_count})
 
-        # Filter out messages with EXCLUDED_SUBTYPES and bot_id
-        messages = list(filter(lambda m: m.get("subtype") not in EXCLUDED_SUBTYPES
-                               and "bot_id" not in m, messages_info))
-        # Reverse the order of messages to process them in chronological order
-        messages = messages[::-1]
+        if len(messages) < 1:
+            return None
 
-        # Mark messages for fetching replies and filter out messages that don't require text
-        filtered_messages = []
-        added_thread_starts = set()  # To track which thread starts have been added
+        # Reverse the order of messages in place to process them in chronological order
+        messages.reverse()
 
-        for message in messages:
-            if "thread_ts" in message:
-                if message["ts"] == message["thread_ts"]:
-                    # Mark thread start messages
-                    message["fetch_replies"] = True
-                    filtered_messages.append(message)
+        added_thread_starts = set()  # To track which thread starts have been added
+        fetched_ts = {message["ts"] for message in messages}
+
+        # Mark messages for fetching replies, dropping messages that don't require text, and start
+        # fetching the replies concurrently. The shared rate limiter still paces the API calls.
+        with ThreadPoolExecutor(max_workers=THREAD_FETCH_WORKERS) as executor:
+            threads = []  # (message, future of its thread replies or None), in display order
+            requested_threads = set()  # Fetch each thread's replies only once
+
+            def _add_message(message, fetch_replies):
+                replies_future = None
+                thread_ts = message.get("thread_ts", message["ts"])
+                if fetch_replies and thread_ts not in requested_threads:
+                    requested_threads.add(thread_ts)
+                    replies_future = executor.submit(
+                        self._load_thread_replies, channel_id, thread_ts, oldest, latest)
+                threads.append((message, replies_future))
+
+            for message in messages:
+                if "thread_ts" not in message:
+                    _add_message(message, fetch_replies=False)
+                elif message["ts"] == message["thread_ts"]:
+                    # Thread start message. Skip the replies call when the thread has no replies
+                    # or its latest reply is older than the window.
+                    has_replies = (message.get("reply_count", 1) > 0
+                                   and float(message.get("latest_reply", message["ts"])) >= start_ts)
+                    _add_message(message, fetch_replies=has_replies)
+                # Check if the thread's start message is already in the messages list
+                elif message["thread_ts"] in fetched_ts:
+                    continue  # Skip this message as it doesn't require text
                 else:
-                    # Check if the thread's start message is already in the messages list
-                    if any(msg["ts"] == message["thread_ts"] for msg in messages):
-                        continue  # Skip this message as it doesn't require text
                     # If the thread's start message is not in the list, add a dummy start message
                     if message["thread_ts"] not in added_thread_starts:
                         dummy_thread_start = {
@@ -248,56 +391,29 @@ class SlackClient:
                             "subtype": "system",
                             "text": "Earlier message not retrieved",
                             "ts": message["thread_ts"],
-                            "fetch_replies": True,
                             "user": "System"
                         }
-                        filtered_messages.append(dummy_thread_start)
+                        _add_message(dummy_thread_start, fetch_replies=True)
                         added_thread_starts.add(message["thread_ts"])
-                    message["fetch_replies"] = True
-                    filtered_messages.append(message)
-            else:
-                message["fetch_replies"] = False
-                filtered_messages.append(message)
+                    _add_message(message, fetch_replies=True)
 
-        messages = filtered_messages
+            messages = []
+            for message, replies_future in threads:
+                messages.append(message)
+                if replies_future is not None:
+                    messages.extend(replies_future.result())
 
-        if len(messages) < 1:
-            return None
+        if len(messages) > 0:
+            logger.debug('Raw message:')
+            logger.debug(pprint.pformat(messages))
 
-        all_target_messages = []
-        for message in messages:
-            all_target_messages.append(message)  # Add the original message to the new list
-
-            if message.get("fetch_replies", True):
-                next_cursor = None
-                while True:
-                    self._wait_api_call()
-                    try:
-                        thread_replies = _fetch_conversations_replies(
-                            channel=channel_id,
-                            timestamp=message["ts"],
-                            oldest=str(start_time.timestamp()),
-                            latest=str(end_time.timestamp()),
-                            limit=1000,
-                            cursor=next_cursor)
-                    except SlackApiError as error:
-                        logger.error('Failed conversation replies: %s', {error})
-                        break
-
-                    if thread_replies is None:
-                        logger.error('Thread replies result is None')
-                        break
-
-                    # Exclude the parent message as it's already in the messages list
-                    for reply in thread_replies["messages"][1:]:
-                        all_target_messages.append(reply)  # Add each reply to the new list
-
-                    if thread_replies["has_more"]:
-                        next_cursor = thread_replies['response_metadata']['next_cursor']
-                    else:
-                        break  # All replies fetched, exit the loop
-
-        messages = all_target_messages
+        # In lazy_users mode, resolve every speaker and mentioned user up front
+        if self._lazy_users:
+            user_ids = {message["user"] for message in messages
+                        if "user" in message and message.get("subtype") not in SYSTEM_SUBTYPES}
+            for message in messages:
+                user_ids.update(_USER_RE.findall(message["text"]))
+            self._resolve_users(user_ids)
 
         messages_texts = []
         for message in messages:
@@ -313,19 +429,18 @@ class SlackClient:
                 speaker_name = self.get_user_name(message["user"]) or "Somebody"
 
             # Get message body from result dict.
-            body_text = message["text"].replace("\n", "\\n")
-
-            # Replace User IDs in a chat message text with user names.
-            body_text = self.replace_user_id_with_name(body_text)
+            # Keep each message on one line. Backslashes are escaped first so that
+            # unescape_message_text can tell a typed "\\n" from a line break.
+            body_text = message["text"].replace("\\", "\\\\").replace("\n", "\\n")
 
-            # Replace all channel ids with "other channel"
-            body_text = re.sub(r"<#[A-Z0-9]+>", " other channel ", body_text)
+            # Replace User IDs with user names and channel ids with "other channel" in one pass.
+            body_text = self._replace_mentions(body_text)
 
             # Replace all @here, @channel, @everyone mentions with "@allmembers"
-            body_text = re.sub(r"<!here>|<!channel>|<!everyone>", "@allmembers", body_text)
+            body_text = _BROADCAST_RE.sub("@allmembers", body_text)
 
             # Replace all custom user group mentions with the name after the pipe character
-            body_text = re.sub(r"<!subteam\^[A-Z0-9]+\|@([a-zA-Z0-9_]+)>", r" @\1 ", body_text)
+            body_text = _SUBTEAM_RE.sub(r" @\1 ", body_text)
 
             # Construct the final message format
             body_text = f"{speaker_name}: {body_text}"
@@ -344,6 +459,48 @@ class SlackClient:
             return None
         return messages_texts
 
+    def _load_thread_replies(self, channel_id: str, timestamp: str, oldest: str, latest: str) -> list:
+        """
+        Retrieve the replies of a thread within the given time range, following pagination.
+
+        Args:
+            channel_id (str): The ID of the channel containing the thread.
+            timestamp (str): The timestamp of the thread's parent message.
+            oldest (str): The start of the time range, as a Slack timestamp string.
+            latest (str): The end of the time range, as a Slack timestamp string.
+
+        Returns:
+            list: The reply messages, excluding the parent message. If an error occurs,
+                the replies fetched so far are returned.
+        """
+        replies = []
+        next_cursor = None
+        while True:
+            try:
+                thread_replies = self._api_conversations_replies(
+                    channel=channel_id,
+                    timestamp=timestamp,
+                    oldest=oldest,
+                    latest=latest,
+                    limit=1000,
+                    cursor=next_cursor)
+            except SlackApiError as error:
+                logger.error('Failed conversation replies: %s', {error})
+                break
+
+            if thread_replies is None:
+                logger.error('Thread replies result is None')
+                break
+
+            # Exclude the parent message as it's already in the messages list
+            replies.extend(thread_replies["messages"][1:])
+
+            if thread_replies["has_more"]:
+                next_cursor = thread_replies['response_metadata']['next_cursor']
+            else:
+                break  # All replies fetched, exit the loop
+        return replies
+
     def get_user_name(self, user_id: str) -> str:
         """ Get the name of a user with the given ID.
 
@@ -360,8 +517,8 @@ class SlackClient:
             >>> get_user_name('U9999', users)
             None
         """
-        matching_users = [user for user in self.users if user['id'] == user_id]
-        return matching_users[0]['profile']['display_name'] if len(matching_users) > 0 else None
+        self._resolve_user(user_id)
+        return self._display_name_by_id.get(user_id)
 
     def replace_user_id_with_name(self, body_text: str) -> str:
         """ Replace user IDs in a chat message text with user names prefixed with '@'.
@@ -380,56 +537,116 @@ class SlackClient:
             >>> replace_user_id_with_name(body_text, users)
             "Hi @Alice, how are you?"
         """
-        pattern = r"<@([A-Z0-9]+)>"
-        for match in re.finditer(pattern, body_text):
+        def _replace(match):
             user_id = match.group(1)
-            user_name = next(
-                (f"@{user['name']}" for user in self.users if user['id'] == user_id),
-                f"@{user_id}")
-            body_text = body_text.replace(match.group(0), user_name)
-        return body_text
+            self._resolve_user(user_id)
+            return f"@{self._name_by_id.get(user_id, user_id)}"
+
+        return _USER_RE.sub(_replace, body_text)
 
-    def _get_users_info(self, wait_time=3) -> list:
+    def _replace_mentions(self, body_text: str) -> str:
+        """ Replace user mentions with '@' + user name and channel mentions with "other channel" in a single scan.
+
+        Args:
+            body_text (str): The text of a chat message.
+
+        Returns:
+            str: The text with `<@U...>` and `<#C...>` mentions replaced.
         """
-        Retrieve information about all users in the Slack workspace.
+        def _replace(match):
+            if match.group(1) == "#":
+                return " other channel "
+            user_id = match.group(2)
+            self._resolve_user(user_id)
+            return f"@{self._name_by_id.get(user_id, user_id)}"
+
+        return _MENTION_RE.sub(_replace, body_text)
+
+    def _resolve_user(self, user_id: str):
+        """
+        In lazy_users mode, look up a user not seen before via users.info and add it to the name indexes.
+        Unknown or deleted users are remembered so they are not requested again.
+
+        Args:
+            user_id (str): The ID of the user to resolve.
+        """
+        if (not self._lazy_users or user_id in self._name_by_id
+                or user_id in self._unresolved_user_ids):
+            return
+
+        try:
+            user = self._api_users_info(user=user_id)["user"]
+        except SlackApiError as error:
+            logger.warning('Failed to get user info for %s: %s', user_id, error)
+            self._unresolved_user_ids.add(user_id)
+            return
+
+        user = User.from_dict(user)
+        if user.deleted:
+            self._unresolved_user_ids.add(user_id)
+            return
+        self._display_name_by_id[user_id] = user.display_name
+        self._name_by_id[user_id] = user.name
+
+    def _resolve_users(self, user_ids, max_workers: int = 4):
+        """
+        Resolve several user IDs concurrently in lazy_users mode. IDs already known are skipped.
 
-        This method retrieves a list of dictionaries containing information about each user,
-        including their ID, name, and other metadata. It handles pagination by making multiple
-        API calls if necessary.
+        Args:
+            user_ids (iterable): The IDs of the users to resolve.
+            max_workers (int, optional): The maximum number of concurrent users.info calls. Defaults to 4.
+        """
+        pending = [user_id for user_id in user_ids
+                   if user_id not in self._name_by_id and user_id not in self._unresolved_user_ids]
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._resolve_user, pending))
+
+    @staticmethod
+    def _build_user_indexes(users: list) -> tuple:
+        """ Build user ID lookup tables for display names and names.
 
         Args:
-            wait_time (int, optional): The time to wait between API calls in seconds. Defaults to 3 seconds.
+            users (list[User]): The users to index.
+
+        Returns:
+            tuple: Two dicts mapping user IDs to display names and to names respectively.
+                Deleted users are skipped.
+        """
+        display_name_by_id = {}
+        name_by_id = {}
+        for user in users:
+            if user.deleted:
+                continue
+            display_name_by_id[user.id] = user.display_name
+            name_by_id[user.id] = user.name
+        return display_name_by_id, name_by_id
+
+    def _get_users_info(self) -> list:
+        """
+        Retrieve information about all users in the Slack workspace.
+
+        This method retrieves every user, including their ID, name and display name.
+        It handles pagination by making multiple API calls if necessary.
 
         Returns:
-            list: A list of dictionaries containing information about each user,
-                including their ID, name, and other metadata.
+            list[User]: The users in the Slack workspace.
 
         Raises:
             SlackApiError: If an error occurs while attempting to retrieve the user information.
 
         Examples:
-            >>> users = get_users_info(wait_time=5)
+            >>> users = get_users_info()
             >>> print(users[0])
-            {
-                'id': 'U12345678',
-                'name': 'alice',
-                'real_name': 'Alice Smith',
-                'email': 'alice@example.com',
-                ...
-            }
+            User(id='U12345678', name='alice', display_name='Alice', deleted=False)
         """
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def _fetch_users_info(cursor=None, limit=100):
-            return self.client.users_list(cursor=cursor, limit=limit)
-
         try:
             users = []
             next_cursor = None
             while True:
-                self._wait_api_call()
-                users_info = _fetch_users_info(cursor=next_cursor)
-                time.sleep(wait_time)
-                users.extend(users_info['members'])
+                users_info = self._api_users_list(cursor=next_cursor)
+                users.extend(User.from_dict(user) for user in users_info['members'])
                 if users_info["response_metadata"]["next_cursor"]:
                     next_cursor = users_info["response_metadata"]["next_cursor"]
                 else:
@@ -442,9 +659,10 @@ class SlackClient:
     def _get_channels_info(self) -> list:
         """
         Retrieve information about all public channels in the Slack workspace.
+        It handles pagination by making multiple API calls if necessary.
 
         Returns:
-            list: A list of dictionaries containing information about each public channel, including its ID, name, and other metadata. sorted by channel name.
+            list[Channel]: The public channels selected for summarization, sorted by channel name.
 
         Raises:
             SlackApiError: If an error occurs while attempting to retrieve the channel information.
@@ -452,36 +670,134 @@ class SlackClient:
         Examples:
             >>> channels = get_channels_info()
             >>> print(channels[0])
-            {
-                'id': 'C12345678',
-                'name': 'general',
-                'is_channel': True,
-                'is_archived': False,
-                ...
-            }
+            Channel(id='C12345678', name='general', is_archived=False, is_channel=True, ...)
         """ 
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def _fetch_channels_info():
-            return self.client.conversations_list(
-                    types="public_channel", exclude_archived=True, limit=1000)
-
         try:
-            self._wait_api_call()
-            result = _fetch_channels_info()
-            channels_info = [
-                channel for channel in result['channels']
-                if not channel["is_archived"] and channel["is_channel"]
-                    and ((not channel["is_ext_shared"] and not channel["is_org_shared"])
-                          or ADD_SUMMARY_TAG in channel["purpose"]["value"])
-                    and SKIP_SUMMARY_TAG not in channel["purpose"]["value"]
-            ]
+            channels_info = []
+            next_cursor = None
+            while True:
+                result = self._api_conversations_list(cursor=next_cursor)
+                # Filter each page as it arrives so only selected channels are kept
+                for channel in map(Channel.from_dict, result['channels']):
+                    # Check the cheap flags before touching the purpose text
+                    if channel.is_archived or not channel.is_channel:
+                        continue
+                    if SKIP_SUMMARY_TAG in channel.purpose:
+                        continue
+                    if ((not channel.is_ext_shared and not channel.is_org_shared)
+                            or ADD_SUMMARY_TAG in channel.purpose):
+                        channels_info.append(channel)
+                next_cursor = (result.get("response_metadata") or {}).get("next_cursor")
+                if not next_cursor:
+                    break
             channels_info = sort_by_numeric_prefix(channels_info,
-                                                    get_key=lambda x: x["name"])
+                                                    get_key=lambda x: x.name)
             return channels_info
         except SlackApiError as error:
             logger.error('Failed to get channels info: %s', {error})
             raise SlackApiError('Failed to get channels info', error) from error
 
-    def _wait_api_call(self):
-        """ most of api call limit is 20 per minute """
-        time.sleep(SLACK_API_WAITTIME)
+    # Slack API calls. Each one waits for the shared rate limiter first.
+
+    def _api_conversations_join(self, channel):
+        self._rate_limiter.acquire()
+        return self.client.conversations_join(channel=channel)
+
+    def _api_conversations_history(self, channel, oldest, latest, limit, cursor=None):
+        self._rate_limiter.acquire()
+        return self.client.conversations_history(
+            channel=channel,
+            oldest=oldest,
+            latest=latest,
+            limit=limit,
+            include_all_metadata=False,
+            cursor=cursor)
+
+    def _api_conversations_replies(self, channel, timestamp, oldest, latest, limit, cursor=None):
+        self._rate_limiter.acquire()
+        return self.client.conversations_replies(
+            channel=channel,
+            ts=timestamp,
+            oldest=oldest,
+            latest=latest,
+            limit=limit,
+            cursor=cursor)
+
+    def _api_users_list(self, cursor=None, limit=100):
+        self._rate_limiter.acquire()
+        return self.client.users_list(cursor=cursor, limit=limit)
+
+    def _api_users_info(self, user):
+        self._rate_limiter.acquire()
+        return self.client.users_info(user=user)
+
+    def _api_conversations_list(self, cursor=None, limit=1000):
+        self._rate_limiter.acquire()
+        return self.client.conversations_list(
+                types="public_channel", exclude_archived=True, limit=limit, cursor=cursor)
+
+    def _load_or_fetch(self, name: str, fetch, item_type: type, refresh: bool = False):
+        """
+        Return the cached list `name`, or call `fetch` and cache its result.
+
+        Args:
+            name (str): The name of the cached list, e.g. "users".
+            fetch (callable): A function that retrieves the list from the Slack API.
+            item_type (type): The dataclass of the list items, used to rebuild them from the cache.
+            refresh (bool, optional): If True, ignore the cache and always call `fetch`. Defaults to False.
+
+        Returns:
+            The cached or freshly fetched list.
+        """
+        items = None if refresh else self._load_cached(name, item_type, SLACK_CACHE_TTL)
+        if items is None:
+            items = fetch()
+            self._save_cached(name, items)
+        return items
+
+    def _cache_path(self, name: str) -> Path:
+        """ Return the cache file path for `name`, keyed by a hash of the API token. """
+        return SLACK_CACHE_DIR / f"{name}-{self._cache_key}.json"
+
+    def _load_cached(self, name: str, item_type: type, ttl_seconds: float):
+        """
+        Load a previously cached list from disk.
+
+        Args:
+            name (str): The name of the cached list, e.g. "users".
+            item_type (type): The dataclass of the list items.
+            ttl_seconds (float): The maximum age of the cache file in seconds.
+
+        Returns:
+            list: The cached items, or None if there is no cache file, it is older than `ttl_seconds`,
+                or it cannot be read.
+        """
+        path = self._cache_path(name)
+        try:
+            if time.time() - path.stat().st_mtime > ttl_seconds:
+                return None
+            with path.open(encoding="utf-8") as file:
+                return [item_type(**item) for item in json.load(file)]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as error:
+            logger.warning('Failed to load %s cache: %s', name, error)
+            return None
+
+    def _save_cached(self, name: str, items: list):
+        """
+        Save a list of dataclass items to the on-disk cache. Failures are logged and otherwise ignored.
+
+        Args:
+            name (str): The name of the cached list, e.g. "users".
+            items (list): The items to cache.
+        """
+        path = self._cache_path(name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as file:
+                json.dump([asdict(item) for item in items], file, ensure_ascii=False)
+            tmp_path.replace(path)
+        except OSError as error:
+            logger.warning('Failed to save %s cache: %s', name, error)
@@ -2,45 +2,56 @@
 
 import re
 import time
-from functools import wraps
+import threading
 import emoji
 
-def retry(max_retries=5, initial_sleep_time=10, error_type=Exception):
-    """
-    A decorator that retries the function call if a specified exception is raised,
-    with an exponential backoff strategy.
+_NUM_PREFIX_RE = re.compile(r'^(\d+)')
+_CUSTOM_EMOJI_RE = re.compile(r":[-_a-zA-Z0-9]+?:")
 
-    Args:
-        max_retries (int, optional): The maximum number of retries. Defaults to 5.
-        initial_sleep_time (int, optional): The initial sleep time in seconds between retries. Defaults to 10.
-        error_type (Exception, optional): The exception class to catch and retry if raised. Defaults to Exception.
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter.
 
-    Returns:
-        wrapper: A wrapper function that will handle the retries.
+    Tokens are refilled continuously at `rate_per_sec` up to `capacity`. Each call to
+    `acquire` consumes one token, sleeping only as long as needed for a token to become available.
+    Concurrent callers reserve tokens in turn, so the overall rate is respected across threads.
 
-    Raises:
-        error_type: If 'func' raises 'error_type' and max_retries is reached.
+    Args:
+        rate_per_sec (float): The number of tokens added per second. None means unlimited,
+            so `acquire` never waits.
+        capacity (int, optional): The maximum number of tokens the bucket can hold. Defaults to 1.
 
     Example:
-        @retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-        def post_summary(slack_client, summary, channel_id):
-            # function implementation here
+        >>> limiter = TokenBucket(rate_per_sec=20/60)
+        >>> limiter.acquire()  # returns immediately, then at most 20 calls per minute
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sleep_time = initial_sleep_time
-            for i in range(max_retries):
-                try:
-                    result = func(*args, **kwargs)
-                    return result
-                except error_type as err:
-                    if i == max_retries - 1:
-                        raise err
-                    time.sleep(sleep_time)
-                    sleep_time *= 2  # double the sleep time for the next retry
-        return wrapper
-    return decorator
+
+    @classmethod
+    def from_interval(cls, interval_sec: float) -> "TokenBucket":
+        """ Build a limiter allowing one call per `interval_sec` seconds, unlimited if it is 0 or less. """
+        return cls(rate_per_sec=1 / interval_sec if interval_sec > 0 else None)
+
+    def __init__(self, rate_per_sec: float, capacity: int = 1):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ Block until a token is available, then consume it. """
+        if self.rate_per_sec is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last_refill) * self.rate_per_sec)
+            self._last_refill = now
+            # A negative balance reserves a future token for this caller
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 def sort_by_numeric_prefix(lst, get_key=lambda x: x):
     """
@@ -59,17 +70,15 @@ def sort_by_numeric_prefix(lst, get_key=lambda x: x):
     Example:
         >>> lst = [{"name":"a"}, {"name":"1abc"}, {"name":"Z"}, {"name":"う"}, {"name":"あ"}, {"name":"14:A"}]
         >>> sort_by_numeric_prefix(lst, get_key=lambda x: x["name"])
-        [{'name': '14:A'}, {'name': '1abc'}, {'name': 'Z'}, {'name': 'a'}, {'name': 'あ'}, {'name': 'う'}]
+        [{'name': '1abc'}, {'name': '14:A'}, {'name': 'Z'}, {'name': 'a'}, {'name': 'あ'}, {'name': 'う'}]
 
     """
-    digits_list = [s for s in lst if re.match(r'^(\d+)', get_key(s))]
-    string_list = [s for s in lst if re.match(r'^\D', get_key(s))]
-
-    def numkey(n: str):
-        match = re.match(r'^(\d+)', get_key(n))
-        return int(match.group(1))
+    def sort_key(item):
+        key = get_key(item)
+        match = _NUM_PREFIX_RE.match(key)
+        return (0, int(match.group(1))) if match else (1, key)
 
-    return sorted(digits_list, key=numkey) + sorted(string_list, key=get_key)
+    return sorted(lst, key=sort_key)
 
 
 def remove_emoji(text: str) -> str:
@@ -87,10 +96,11 @@ def remove_emoji(text: str) -> str:
         >>> remove_custom_emoji(text)
         'Hello, world!  '
     """
-    # Remove Unicode emojis
-    text = emoji.replace_emoji(text, replace='')
+    # Remove Unicode emojis. They are never ASCII, so pure ASCII text can skip the scan.
+    if not text.isascii():
+        text = emoji.replace_emoji(text, replace='')
 
     # Remove Slack custom emojis
-    custom_pattern = r":[-_a-zA-Z0-9]+?:"
-    text = re.sub(custom_pattern, "", text)
+    if ":" in text:
+        text = _CUSTOM_EMOJI_RE.sub("", text)
     return text
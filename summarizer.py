@@ -8,13 +8,20 @@ import os
 import sys
 from datetime import datetime, timedelta
 import time
+import random
+import hashlib
+import json
+import tempfile
+from itertools import groupby
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import pytz
 import openai
 import tiktoken
-from slack_sdk.errors import SlackApiError
 from lib.slack import SlackClient
-from lib.slack import POST_SUMMARY_TAG, REPLY_PREFIX
-from lib.utils import remove_emoji, retry
+from lib.slack import POST_SUMMARY_TAG, REPLY_PREFIX, unescape_message_text
+from lib.utils import TokenBucket, remove_emoji
 
 # Load settings from environment variables
 OPEN_AI_TOKEN = os.environ.get('OPEN_AI_TOKEN', '').strip()
@@ -25,15 +32,120 @@ TIMEZONE = str(os.environ.get('TIMEZONE') or 'Asia/Tokyo').strip()
 TEMPERATURE = float(os.environ.get('TEMPERATURE') or 0.3)
 CHAT_MODEL = str(os.environ.get('CHAT_MODEL') or "gpt-3.5-turbo").strip()
 ENCODING_MODEL = str(os.environ.get('ENCODING_MODEL') or "cl100k_base").strip()
+# tiktoken reads this when an encoding is first loaded; keeping the BPE file on disk avoids
+# downloading it again on every cold start
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tiktoken_cache"))
 DEBUG = str(os.environ.get('DEBUG') or "").strip() != ""
 MAX_BODY_TOKENS = int(os.environ.get('MAX_BODY_TOKENS') or 3000)
 REQUEST_INTERVAL = float(os.environ.get('REQUEST_INTERVAL') or 1/60)
 SUMMARIZE_PROMPT = os.environ.get('SUMMARIZE_PROMPT', '').strip()
 OUTPUT_SLACK = os.environ.get('OUTPUT_SLACK', '').strip()
+LAZY_USERS = str(os.environ.get('SLACK_LAZY_USERS') or "").strip() != ""
+SUMMARIZE_CONCURRENCY = int(os.environ.get('SUMMARIZE_CONCURRENCY') or 4)
+LOAD_CONCURRENCY = int(os.environ.get('LOAD_CONCURRENCY') or 8)
+SUMMARY_CACHE_DIR = os.environ.get('SUMMARY_CACHE_DIR', '').strip()
+MIN_SUMMARIZE_TOKENS = int(os.environ.get('MIN_SUMMARIZE_TOKENS') or 20)
+MAX_RETRY_WAIT = float(os.environ.get('MAX_RETRY_WAIT') or 60)
+# Slack rejects chat.postMessage texts longer than 40000 characters
+MAX_POST_LENGTH = int(os.environ.get('MAX_POST_LENGTH') or 39000)
+
+# Shared across summarize workers: at most one OpenAI request per REQUEST_INTERVAL seconds
+openai_rate_limiter = TokenBucket.from_interval(REQUEST_INTERVAL)
+
+def get_summary_cache_path(messages: list[dict]):
+    """
+    Get the file path of the cached summary for the given request.
+
+    Args:
+        messages (list[dict]): The chat messages sent to the OpenAI API, including the system prompt.
+
+    Returns:
+        Path: The cache file path, keyed by a hash of the model settings and the whole request,
+            or None if SUMMARY_CACHE_DIR is not set.
+    """
+    if not SUMMARY_CACHE_DIR:
+        return None
+    key = json.dumps([CHAT_MODEL, TEMPERATURE, messages], ensure_ascii=False)
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return Path(SUMMARY_CACHE_DIR).expanduser() / f"{digest}.txt"
+
+def load_cached_summary(cache_path: Path):
+    """
+    Load a cached summary.
+
+    Args:
+        cache_path (Path): The cache file path from get_summary_cache_path.
+
+    Returns:
+        str: The cached summary, or None if there is no cache file or it cannot be read.
+    """
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as error:
+        print(f"Warning: failed to load summary cache: {error}")
+        return None
+
+def save_cached_summary(cache_path: Path, summary: str):
+    """
+    Save a summary to the cache. Failures are reported and otherwise ignored.
+
+    The summary is written to a temporary file first and then moved into place, so a concurrent
+    reader never sees a partially written file.
+
+    Args:
+        cache_path (Path): The cache file path from get_summary_cache_path.
+        summary (str): The summary to cache.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_path.parent,
+                                         suffix=".tmp", delete=False) as file:
+            file.write(summary)
+        Path(file.name).replace(cache_path)
+    except OSError as error:
+        print(f"Warning: failed to save summary cache: {error}")
+
+# OpenAI errors that are retried with backoff, and the message returned once retries run out
+RETRIABLE_ERROR_RESPONSES = {
+    openai.error.ServiceUnavailableError: "The service is currently unavailable. Please try again later.",
+    openai.error.APIConnectionError: "A connection error occurred. Please check your internet connection and try again.",
+    openai.error.RateLimitError: "Exceeded rate limit. Please try again later.",
+}
+RETRIABLE_ERRORS = tuple(RETRIABLE_ERROR_RESPONSES)
+
+@lru_cache(maxsize=4)
+def get_system_prompt(language: str) -> str:
+    """
+    Build the system prompt explaining the chat log format. It only depends on the language,
+    so it is built once per run.
+
+    Args:
+        language (str): The language to use for the summary.
+
+    Returns:
+        str: The system prompt.
+    """
+    return "\n".join([
+        "チャットログは、'発言者（Slackのユーザ）: メッセージ（Slackの投稿）'の形式でコロンで区切られ、各メッセージが新しい行に配置されています。",
+        "'->'で始まるメッセージは、前のメッセージへの返信です。",
+        "'@'で始まる単語はメンションであり、チーム内の特定の人物やグループを指し示すことを意味します。",
+        "メッセージ内の`\\n`は改行を表します。",
+        "この構造とこれらの要素を考慮して、メッセージ間の文脈と関係を理解しながら要約してください。",
+        "要約は、次のようにMarkdown構文を使用して箇条書きのリストとして提示してください。",
+        " - ポイント1",
+        " - ポイント2",
+        " - ポイント3",
+        "また、要約内で特定の人物やグループを指し示す場合に'@'を付けないようにしてください。",
+        f"ユーザーは{language}のみを理解します。",
+        f"そのため、要約を生成するアシスタントは{language}で要約を書く必要があります。",
+    ])
 
 def summarize(text: str, prompt_text: str, language: str, max_retries: int = 3, initial_wait_time: int = 2) -> str:
     """
     Summarize a chat log in bullet points, in the specified language, using a given prompt.
+    If SUMMARY_CACHE_DIR is set, a summary previously generated for the same request is reused.
 
     Args:
         text (str): The chat log to summarize, in the format "Speaker: Message" separated by line breaks.
@@ -51,20 +163,7 @@ def summarize(text: str, prompt_text: str, language: str, max_retries: int = 3,
     """
     messages = [{
         "role": "system",
-        "content": "\n".join([
-            "チャットログは、'発言者（Slackのユーザ）: メッセージ（Slackの投稿）'の形式でコロンで区切られ、各メッセージが新しい行に配置されています。",
-            "'->'で始まるメッセージは、前のメッセージへの返信です。",
-            "'@'で始まる単語はメンションであり、チーム内の特定の人物やグループを指し示すことを意味します。",
-            "メッセージ内の`\\n`は改行を表します。",
-            "この構造とこれらの要素を考慮して、メッセージ間の文脈と関係を理解しながら要約してください。",
-            "要約は、次のようにMarkdown構文を使用して箇条書きのリストとして提示してください。",
-            " - ポイント1",
-            " - ポイント2",
-            " - ポイント3",
-            "また、要約内で特定の人物やグループを指し示す場合に'@'を付けないようにしてください。",
-            f"ユーザーは{language}のみを理解します。",
-            f"そのため、要約を生成するアシスタントは{language}で要約を書く必要があります。",
-        ])
+        "content": get_system_prompt(language)
     }, {
         "role": "user",
         "content": "\n".join([
@@ -73,58 +172,44 @@ def summarize(text: str, prompt_text: str, language: str, max_retries: int = 3,
         ])
     }]
 
-    response = None
+    cache_path = get_summary_cache_path(messages)
+    summary = load_cached_summary(cache_path) if cache_path is not None else None
+    if summary is not None:
+        return summary
+
+    summary = None
     error_response = ""
     wait_time = initial_wait_time
     for i in range(max_retries):
         try:
+            openai_rate_limiter.acquire()  # wait only if requests come in faster than the rate limit
             response = openai.ChatCompletion.create(
                 model=CHAT_MODEL,
                 temperature=TEMPERATURE,
                 messages=messages
             )
-            time.sleep(REQUEST_INTERVAL)  # wait to avoid exceeding rate limit
+            summary = response['choices'][0]['message']['content']
             break
-        except openai.error.ServiceUnavailableError as error:
+        except RETRIABLE_ERRORS as error:
             if DEBUG:
                 print(f"Openai error: {error}")
 
             if i < max_retries - 1:  # i is zero indexed
-                time.sleep(wait_time)  # wait before trying again
-                wait_time *= 2  # double the wait time for the next retry
+                # Full jitter keeps concurrent workers from retrying in lockstep
+                time.sleep(random.uniform(0, wait_time))
+                wait_time = min(MAX_RETRY_WAIT, wait_time * 2)
                 continue
             else:
-                error_response = "The service is currently unavailable. Please try again later."
+                error_response = next(message for error_type, message in RETRIABLE_ERROR_RESPONSES.items()
+                                      if isinstance(error, error_type))
                 break
         except openai.error.Timeout as error:
             if DEBUG:
                 print(f"Openai error: {error}")
 
-            estimated_tokens = estimate_openai_chat_token_count(text)
+            estimated_tokens = estimate_openai_chat_token_count(text, exact=False)
             error_response = f"Timeout error occurred. The estimated token count is {estimated_tokens}. Please try again with shorter text."
             break
-        except openai.error.APIConnectionError as error:
-            if DEBUG:
-                print(f"Openai error: {error}")
-                
-            if i < max_retries - 1:  # i is zero indexed
-                time.sleep(wait_time)  # wait before trying again
-                wait_time *= 2  # double the wait time for the next retry
-                continue
-            else:
-                error_response = "A connection error occurred. Please check your internet connection and try again."
-                break
-        except openai.error.RateLimitError as error:
-            if DEBUG:
-                print(f"Openai error: {error}")
-
-            if i < max_retries - 1:
-                time.sleep(wait_time)
-                wait_time *= 2
-                continue
-            else:
-                error_response = "Exceeded rate limit. Please try again later."
-                break
         except openai.error.InvalidRequestError as error:
             if DEBUG:
                 print(f"Openai error: {error}")
@@ -142,9 +227,12 @@ def summarize(text: str, prompt_text: str, language: str, max_retries: int = 3,
         return error_response
 
     if DEBUG:
-        print(f"Response:\n{response['choices'][0]['message']['content']}")
+        print(f"Response:\n{summary}")
 
-    return response['choices'][0]['message']['content']
+    if cache_path is not None:
+        save_cached_summary(cache_path, summary)
+
+    return summary
 
 def get_time_range(hours_back: int = None) -> (datetime, datetime):
     """
@@ -179,12 +267,27 @@ def get_time_range(hours_back: int = None) -> (datetime, datetime):
 
     return start_time, end_time
 
-def estimate_openai_chat_token_count(text: str) -> int:
+@lru_cache(maxsize=4)
+def get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """
+    Get a tiktoken encoding, loading its BPE table only once per process.
+
+    Args:
+        encoding_name (str): The name of the encoding, e.g. "cl100k_base".
+
+    Returns:
+        tiktoken.Encoding: The encoding object.
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+def estimate_openai_chat_token_count(text: str, exact: bool = True) -> int:
     """
     Estimate the number of OpenAI API tokens that would be consumed by sending the given text to the chat API.
 
     Args:
         text (str): The text to be sent to the OpenAI chat API.
+        exact (bool, optional): If False, skip the tokenizer and approximate the count as one token
+            per 3 characters. Defaults to True.
 
     Returns:
         int: The estimated number of tokens that would be consumed by sending the given text to the OpenAI chat API.
@@ -192,72 +295,169 @@ def estimate_openai_chat_token_count(text: str) -> int:
     Examples:
         >>> estimate_openai_chat_token_count("Hello, how are you?")
         7
+        >>> estimate_openai_chat_token_count("Hello, how are you?", exact=False)
+        6
     """
-    encoding = tiktoken.get_encoding(ENCODING_MODEL)
-    token_count = len(encoding.encode(text))
+    if not exact:
+        return len(text) // 3
+
+    encoding = get_encoding(ENCODING_MODEL)
+    token_count = len(encoding.encode_ordinary(text))
 
     return token_count
 
-def split_messages_by_token_count(messages: list[str]) -> list[list[str]]:
+def dedup_messages(messages: list[str]) -> list[str]:
     """
-    Split a list of strings into sublists with a maximum token count.
+    Collapse runs of a message posted verbatim several times in a row.
+
+    Only consecutive repeats are collapsed, since a short reply such as "ok" means something
+    different at each place it is posted. A run is kept once with a multiplier appended.
+
+    Args:
+        messages (list[str]): The chat messages, with replies following their thread start message.
+
+    Returns:
+        list[str]: The messages with consecutive repeats removed.
+
+    Example:
+        >>> dedup_messages(["Alice: +1", "Alice: +1", "Bob: ok", "Alice: +1"])
+        ['Alice: +1 (×2)', 'Bob: ok', 'Alice: +1']
+    """
+    result = []
+    for message, run in groupby(messages):
+        count = sum(1 for _ in run)
+        result.append(message if count == 1 else f"{message} (×{count})")
+    return result
+
+def split_messages_with_token_counts(messages: list[str]) -> list[tuple[list[str], int]]:
+    """
+    Split a list of strings into sublists with a maximum token count, returning each sublist's token count.
+
+    Messages are grouped into threads (a thread start followed by its replies). Threads that do not fit
+    in MAX_BODY_TOKENS are cut into pieces, each piece of a reply run starting with its thread start
+    message when both fit together. The pieces are then packed in chat order, each sublist taking
+    pieces while they fit, so every sublist is a contiguous part of the conversation.
+    Only a single message longer than MAX_BODY_TOKENS can make a sublist exceed the limit.
 
     Args:
         messages (list[str]): A list of strings to be split.
 
     Returns:
-        list[list[str]]: A list of sublists, where each sublist has a token count less than or equal to max_body_tokens.
+        list[tuple[list[str], int]]: A list of (sublist, token count) pairs, where each sublist has a token count
+            less than or equal to max_body_tokens.
     """
+    # Encode all messages in one batch call, which tiktoken runs on parallel native threads
+    encoding = get_encoding(ENCODING_MODEL)
     body_token_counts = [
-        estimate_openai_chat_token_count(message) for message in messages
+        len(tokens) for tokens in
+        encoding.encode_ordinary_batch(messages, num_threads=os.cpu_count() or 4)
     ]
-    result = []
-    current_sublist = []
+
+    # Cut the messages into pieces of message indices that each fit in MAX_BODY_TOKENS
+    pieces = []  # (token count, message indices)
+    current_piece = []
     current_count = 0
-    thread_start_message = None
+    thread_start_index = None
 
-    for message, count in zip(messages, body_token_counts):
+    for index, (message, count) in enumerate(zip(messages, body_token_counts)):
         # Check if the message is a thread start or a reply
-        if not message.startswith(REPLY_PREFIX):
-            thread_start_message = message
-
-        # If adding the current message exceeds the token limit
-        if current_count + count > MAX_BODY_TOKENS:
-            # If there's a thread start message, prepend it to the new segment
-            if thread_start_message:
-                current_sublist.insert(0, thread_start_message)
-                current_count += estimate_openai_chat_token_count(thread_start_message)
-
-            result.append(current_sublist)
-            current_sublist = []
+        is_reply = message.startswith(REPLY_PREFIX)
+        if not is_reply:
+            thread_start_index = index
+
+        # Start a new piece at every thread start, and when adding the message exceeds the token limit
+        if current_piece and (not is_reply or current_count + count > MAX_BODY_TOKENS):
+            pieces.append((current_count, current_piece))
+            current_piece = []
             current_count = 0
-        else:
-            current_sublist.append(message)
-            current_count += count
 
-    # Append any remaining messages
-    if current_sublist:
-        result.append(current_sublist)
+            # If the message is a reply, prepend its thread start message to the new piece,
+            # unless the two together would not fit
+            if (is_reply and thread_start_index is not None
+                    and body_token_counts[thread_start_index] + count <= MAX_BODY_TOKENS):
+                current_piece.append(thread_start_index)
+                current_count += body_token_counts[thread_start_index]
 
-    return result
+        current_piece.append(index)
+        current_count += count
+
+    if current_piece:
+        pieces.append((current_count, current_piece))
+
+    # Pack the pieces in chat order. A thread start carried into several pieces of
+    # the same sublist is kept and counted once.
+    result = []  # (set of message indices, token count)
+    current_indices = set()
+    current_count = 0
+    for count, piece in pieces:
+        added = sum(body_token_counts[index] for index in piece if index not in current_indices)
+        if current_indices and current_count + added > MAX_BODY_TOKENS:
+            result.append((current_indices, current_count))
+            current_indices = set()
+            current_count = 0
+            added = count
+        current_indices.update(piece)
+        current_count += added
+
+    if current_indices:
+        result.append((current_indices, current_count))
+
+    return [([messages[index] for index in sorted(indices)], count) for indices, count in result]
 
-@retry(max_retries=5, initial_sleep_time=10, error_type=SlackApiError)
-def post_summary(slack_client, summary, channel_id=None):
+def summarize_chunk(messages: list[str], token_count: int, prompt_text: str, language: str) -> str:
     """
-    Post a summary to a Slack channel.
+    Summarize a chunk of chat messages, skipping the API call for chunks too small to need a summary.
 
     Args:
-        slack_client (SlackClient): The Slack client.
-        summary (str): The summary to post.
-        channel_id (str, optional): The ID of the channel to post to. If not provided, defaults to CHANNEL_ID.
+        messages (list[str]): The chat messages of the chunk.
+        token_count (int): The token count of the chunk.
+        prompt_text (str): The prompt to guide the summarization.
+        language (str): The language to use for the summary.
 
-    Raises:
-        SlackApiError: If an error occurs.
+    Returns:
+        str: The summary, or the messages themselves as bullet points if the chunk has fewer than
+            MIN_SUMMARIZE_TOKENS tokens.
     """
-    if channel_id is None:
-        channel_id = CHANNEL_ID
-    slack_client.post_message(summary, channel_id)
-    
+    if token_count < MIN_SUMMARIZE_TOKENS:
+        # Replies are nested under their thread start message. Line breaks, escaped for the
+        # chat log, are restored and their continuation lines indented under the bullet.
+        bullets = []
+        for message in messages:
+            if message.startswith(REPLY_PREFIX):
+                indent, message = "   ", message[len(REPLY_PREFIX):]
+            else:
+                indent = " "
+            lines = unescape_message_text(message).split("\n")
+            bullets.append(f"{indent}- " + f"\n{indent}  ".join(lines))
+        return "\n".join(bullets)
+    return summarize("\n".join(messages), prompt_text, language)
+
+def pack_posts(parts: list, max_length: int = MAX_POST_LENGTH) -> list:
+    """
+    Join text parts with newlines into as few Slack posts as possible.
+
+    Parts are never split, so a post only breaks on a part boundary. A part longer than
+    `max_length` on its own is still posted as a single message.
+
+    Args:
+        parts (list): The texts to join, in posting order.
+        max_length (int, optional): The maximum length of a post. Defaults to MAX_POST_LENGTH.
+
+    Returns:
+        list: The texts to post.
+
+    Example:
+        >>> pack_posts(["title", "a" * 5, "b" * 5], max_length=12)
+        ['title\naaaaa', 'bbbbb']
+    """
+    posts = []
+    for part in parts:
+        if posts and len(posts[-1]) + 1 + len(part) <= max_length:
+            posts[-1] += "\n" + part
+        else:
+            posts.append(part)
+    return posts
+
 def runner():
     """
     The main function to run the Slack summarizer application.
@@ -270,6 +470,8 @@ def runner():
     5. Retrieves messages from Slack channels.
     6. Summarizes the messages and posts the summaries back to their respective Slack channels.
     7. Posts a consolidated summary of all channels to a specified Slack channel (CHANNEL_ID).
+       The consolidated summary is a plain concatenation of the channel summaries; no extra
+       OpenAI request is made for it, so a run makes one request per chunk at most.
     
     Raises:
         SystemExit: If any of the required environment variables are not set.
@@ -282,7 +484,7 @@ def runner():
     openai.api_key = OPEN_AI_TOKEN
 
     # Set Slack Client
-    slack_client = SlackClient(slack_api_token=SLACK_BOT_TOKEN)
+    slack_client = SlackClient(slack_api_token=SLACK_BOT_TOKEN, lazy_users=LAZY_USERS)
     start_time, end_time = get_time_range()
 
     # Set Prompt Text
@@ -291,49 +493,59 @@ def runner():
     else:
         prompt_text = SUMMARIZE_PROMPT
 
-    channel_summaries = []
-    for channel in slack_client.channels:
-        if DEBUG:
-            print(f"Channel: {channel['name']}, {channel['id']}")
+    # Slack loading and OpenAI summarizing run as a pipeline: as soon as a channel's messages are
+    # loaded, its chunks are queued for summarizing while other channels are still loading.
+    with ThreadPoolExecutor(max_workers=SUMMARIZE_CONCURRENCY) as summarize_executor, \
+            ThreadPoolExecutor(max_workers=LOAD_CONCURRENCY) as load_executor:
 
-        messages = slack_client.load_messages(channel["id"], start_time,
-                                              end_time)
-        if DEBUG:
-            print(f"Messages: \n{messages}")
+        def load_and_queue(channel):
+            """ Load a channel's messages and queue its chunks, returning the summary futures. """
+            messages = slack_client.load_messages(channel.id, start_time, end_time)
+            if DEBUG:
+                print(f"Channel: {channel.name}, {channel.id}")
+                print(f"Messages: \n{messages}")
 
-        if messages is None:
-            continue
+            if messages is None:
+                return None
 
-        # remove emojis in messages
-        messages = list(map(remove_emoji, messages))
+            # remove emojis in messages, then collapse consecutive repeated messages
+            messages = dedup_messages(list(map(remove_emoji, messages)))
 
-        summary = []
-        for splitted_messages in split_messages_by_token_count(messages):
-            text = summarize("\n".join(splitted_messages), prompt_text, LANGUAGE)
-            summary.append(text)
+            return [summarize_executor.submit(summarize_chunk, splitted_messages, token_count,
+                                              prompt_text, LANGUAGE)
+                    for splitted_messages, token_count in split_messages_with_token_counts(messages)]
 
-        # Post summary to the channel if #post-summary tag is in the channel description
-        if POST_SUMMARY_TAG in channel["purpose"]["value"]:
-            title = f"{start_time.strftime('%Y-%m-%d')} {channel['name']} summary\n\n"
-            channel_summary = title + "\n".join(summary)
-            post_summary(slack_client, channel_summary, channel["id"])
+        channel_futures = [(channel, load_executor.submit(load_and_queue, channel))
+                           for channel in slack_client.channels]
 
-        title = f"----\n<#{channel['id']}>\n"
-        channel_summary = title + "\n".join(summary)
-        channel_summaries.append(channel_summary)
+        channel_summaries = []
+        tagged_posts = []
+        for channel, channel_future in channel_futures:
+            summary_futures = channel_future.result()
+            if summary_futures is None:
+                continue
+            summary = [future.result() for future in summary_futures]
+
+            # Post summary to the channel if #post-summary tag is in the channel description
+            if POST_SUMMARY_TAG in channel.purpose:
+                title = f"{start_time.strftime('%Y-%m-%d')} {channel.name} summary\n"
+                tagged_posts.extend((text, channel.id) for text in pack_posts([title] + summary))
+
+            title = f"----\n<#{channel.id}>\n"
+            channel_summary = title + "\n".join(summary)
+            channel_summaries.append(channel_summary)
 
-    title = f"{start_time.strftime('%Y-%m-%d')} public channels summary\n\n"
+    # All channel summaries go to CHANNEL_ID in as few posts as possible, split between channels
+    title = f"{start_time.strftime('%Y-%m-%d')} public channels summary\n"
+    posts = pack_posts([title] + channel_summaries)
 
     if OUTPUT_SLACK:
-        post_summary(slack_client, title, CHANNEL_ID)
+        tagged_posts.extend((text, CHANNEL_ID) for text in posts)
+    slack_client.post_many(tagged_posts)
     if DEBUG:
-        print(f"Summary: \n{title}")
-
-    for channel_summary in channel_summaries:
-        if OUTPUT_SLACK:
-            post_summary(slack_client, channel_summary, CHANNEL_ID)
-        if DEBUG:
-            print(f"{channel_summary}")
+        print("Summary: ")
+        for text in posts:
+            print(text)
 
 if __name__ == '__main__':
     runner()